@@ -0,0 +1,124 @@
+"""Startup-time benchmark for the rightsize CLI.
+
+Measures `python -X importtime` for `rightsize.cli`, checks that heavy dependencies
+stay out of the import graph, and times a cold start of `--help` for the app and
+each subcommand. Cold starts are measured as overhead above a bare interpreter,
+with Typer's rich help rendering disabled (`TYPER_USE_RICH=0`), so the budget
+covers our own import and dispatch cost rather than rich's rendering, which is
+reported for information only. Exits non-zero when a budget is exceeded, so it
+can gate CI:
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 --command-budget-ms 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules `import rightsize.cli` must not pull in; commands import them on demand.
+DEFERRED_MODULES = ("asyncio", "httpx", "jinja2", "pydantic", "pydantic_settings", "rich")
+
+IMPORT_BUDGET_MS = 150.0
+# Plain `--help` overhead measures ~90-110ms; eagerly importing httpx/pydantic/
+# jinja2/rich again adds ~300ms, so this leaves headroom while still catching it.
+COMMAND_BUDGET_MS = 250.0
+
+RUN_APP = "from rightsize.cli import app; app()"
+
+
+def import_time_ms(module: str) -> tuple[float, list[tuple[float, str]]]:
+    """Return the cumulative import time of ``module`` and the slowest imports by self time."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    by_self: list[tuple[float, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        by_self.append((int(self_us) / 1000.0, name.strip()))
+        if name.strip() == module:
+            total_us = int(cumulative_us)
+    by_self.sort(reverse=True)
+    return total_us / 1000.0, by_self[:10]
+
+
+def loaded_deferred_modules() -> list[str]:
+    code = (
+        "import sys, rightsize.cli; "
+        f"print(' '.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return proc.stdout.split()
+
+
+def subcommands() -> list[str]:
+    from rightsize.cli import app
+
+    return [cmd.name or cmd.callback.__name__ for cmd in app.registered_commands]
+
+
+def median_wall_ms(argv: list[str], runs: int, env: dict[str, str] | None = None) -> float:
+    """Median wall time of ``runs`` fresh processes running ``argv``."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env, check=False)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per command (median reported)")
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--command-budget-ms", type=float, default=COMMAND_BUDGET_MS)
+    args = parser.parse_args()
+
+    failures: list[str] = []
+
+    total_ms, slowest = import_time_ms("rightsize.cli")
+    print(f"import rightsize.cli: {total_ms:.1f}ms (budget {args.import_budget_ms:.0f}ms)")
+    for self_ms, name in slowest:
+        print(f"  {self_ms:8.2f}ms  {name}")
+    if total_ms > args.import_budget_ms:
+        failures.append(f"import rightsize.cli took {total_ms:.1f}ms")
+
+    leaked = loaded_deferred_modules()
+    if leaked:
+        failures.append(f"import rightsize.cli loads deferred modules: {', '.join(leaked)}")
+
+    interpreter_ms = median_wall_ms([sys.executable, "-c", "pass"], args.runs)
+    print(f"\nbare interpreter: {interpreter_ms:.1f}ms")
+    plain_env = {**os.environ, "TYPER_USE_RICH": "0"}
+    print(f"cold start overhead (median of {args.runs}, budget {args.command_budget_ms:.0f}ms):")
+    print(f"  {'plain':>10}  {'rich help':>10}")
+    for command in [[], *([name] for name in subcommands())]:
+        label = " ".join(["rightsize", *command, "--help"])
+        argv = [sys.executable, "-c", RUN_APP, *command, "--help"]
+        plain = median_wall_ms(argv, args.runs, plain_env) - interpreter_ms
+        rich = median_wall_ms(argv, args.runs) - interpreter_ms
+        print(f"  {plain:8.1f}ms  {rich:8.1f}ms  {label}")
+        if plain > args.command_budget_ms:
+            failures.append(f"{label} took {plain:.1f}ms")
+
+    if failures:
+        print("\nStartup budget exceeded:", file=sys.stderr)
+        for failure in failures:
+            print(f"  - {failure}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
-import asyncio
 import csv
 import json
+import sys
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
-from datetime import datetime
+from typing import TYPE_CHECKING, ContextManager
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from rightsize import __version__
-from rightsize.client import OpenRouterClient
-from rightsize.config import Settings
-from rightsize.models import BenchmarkResult, ModelPricing, TestCase
-from rightsize.output import render_results
-from rightsize.pricing import fetch_pricing
-from rightsize.runner import aggregate_results, run_benchmark, run_judging
-from rightsize.template import load_template
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from rightsize.models import BenchmarkResult, ModelPricing, TestCase
+    from rightsize.progress import RunProgress
+
+# Heavy dependencies (rich, httpx, pydantic, jinja2) are imported inside the commands
+# that use them so `--help` and light subcommands start fast.
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -33,8 +34,23 @@ def benchmark(
     output_format: str = typer.Option("table", "--output", "-o", help="table|json|csv"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed outputs and scores"),
     visualize: bool = typer.Option(False, "--visualize", "-V", help="Open results in web visualizer"),
+    show_progress: bool = typer.Option(True, "--progress/--no-progress", help="Live per-model progress on stderr"),
+    metrics_port: int | None = typer.Option(None, "--metrics-port", help="Serve OpenMetrics at http://127.0.0.1:PORT/metrics"),
+    metrics_file: Path | None = typer.Option(None, "--metrics-file", help="Periodically write OpenMetrics to this file"),
 ) -> None:
     """Benchmark prompts against multiple LLMs via OpenRouter."""
+    import asyncio
+
+    from rich.console import Console
+
+    from rightsize.client import OpenRouterClient
+    from rightsize.config import Settings
+    from rightsize.output import render_results
+    from rightsize.pricing import fetch_pricing
+    from rightsize.progress import RunProgress
+    from rightsize.runner import aggregate_results, run_benchmark, run_judging
+    from rightsize.template import load_template
+
     console = Console()
     settings = Settings()
     test_cases = _load_test_cases(csv_file)
@@ -69,15 +85,18 @@ def benchmark(
             timeout=settings.timeout_seconds,
         ) as client:
             pricing = await fetch_pricing(client)
+            progress.set_pricing(pricing)
 
             console.print(f"[dim]Running benchmark on {len(models)} model(s) x {len(test_cases)} test case(s)...[/dim]")
-            run_results = await run_benchmark(
-                test_cases=test_cases,
-                models=models,
-                template=renderer,
-                client=client,
-                concurrency=concurrency,
-            )
+            with _live_progress(progress, "run", show_progress):
+                run_results = await run_benchmark(
+                    test_cases=test_cases,
+                    models=models,
+                    template=renderer,
+                    client=client,
+                    concurrency=concurrency,
+                    progress=progress,
+                )
 
             if verbose:
                 console.print("\n[bold]Model Outputs:[/bold]")
@@ -89,13 +108,15 @@ def benchmark(
                     console.print()
 
             console.print(f"[dim]Judging outputs using {judge_model}...[/dim]")
-            judge_scores = await run_judging(
-                run_results=run_results,
-                test_cases=test_cases,
-                judge_model=judge_model,
-                client=client,
-                concurrency=concurrency,
-            )
+            with _live_progress(progress, "judge", show_progress):
+                judge_scores = await run_judging(
+                    run_results=run_results,
+                    test_cases=test_cases,
+                    judge_model=judge_model,
+                    client=client,
+                    concurrency=concurrency,
+                    progress=progress,
+                )
 
             if verbose:
                 console.print("\n[bold]Judge Scores:[/bold]")
@@ -108,11 +129,19 @@ def benchmark(
             if visualize:
                 _open_visualizer(aggregated, baseline, console)
 
-    asyncio.run(_run())
+    progress = RunProgress()
+    with _metrics_exporters(progress, metrics_port, metrics_file, console):
+        asyncio.run(_run())
 
 
 @app.command()
 def models() -> None:
+    import asyncio
+
+    from rightsize.client import OpenRouterClient
+    from rightsize.config import Settings
+    from rightsize.pricing import fetch_pricing
+
     settings = Settings()
 
     async def _run() -> None:
@@ -126,7 +155,109 @@ def models() -> None:
     asyncio.run(_run())
 
 
+@app.command()
+def sample(
+    log_file: Path = typer.Argument(..., help="Production log (.jsonl or .csv) to sample from"),
+    size: int = typer.Option(20, "--size", "-n", help="Number of test cases to emit"),
+    output: Path | None = typer.Option(None, "--output", "-o", help="Output CSV path (default: stdout)"),
+    input_field: str = typer.Option("input_data", "--input-field", "-i", help="Field holding the input (dotted for nested JSON)"),
+    expected_field: str | None = typer.Option("expected_output", "--expected-field", "-e", help="Field holding the expected output"),
+    stratify_by: str | None = typer.Option(None, "--stratify-by", "-s", help="Label field to stratify by (default: input length buckets)"),
+    threshold: float = typer.Option(0.8, "--threshold", help="Jaccard similarity at which inputs count as near-duplicates"),
+    seed: int = typer.Option(0, "--seed", help="Random seed for reproducible samples"),
+    dedup_capacity: int = typer.Option(1_000_000, "--dedup-capacity", help="Expected distinct inputs; sizes the fixed dedup filter (~26MB per million at --threshold 0.8, more at lower thresholds)"),
+    max_strata: int = typer.Option(100, "--max-strata", help="Labels beyond this many are folded into '(other)'"),
+) -> None:
+    """Build a deduplicated, stratified test CSV from production logs."""
+    from rich.console import Console
+
+    from rightsize.sampling import sample_log
+
+    console = Console(stderr=True)
+    if not log_file.exists():
+        raise typer.BadParameter(f"Log file not found: {log_file}")
+    try:
+        rows, stats = sample_log(
+            log_file,
+            size=size,
+            input_field=input_field,
+            expected_field=expected_field,
+            stratify_by=stratify_by,
+            threshold=threshold,
+            seed=seed,
+            dedup_capacity=dedup_capacity,
+            max_strata=max_strata,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    if not rows:
+        raise typer.BadParameter(f"No rows with a non-empty '{input_field}' field found in {log_file}.")
+
+    fieldnames = ["input_data"]
+    if any(r.expected_output is not None for r in rows):
+        fieldnames.append("expected_output")
+    with (output.open("w", newline="") if output else nullcontext(sys.stdout)) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        for r in rows:
+            writer.writerow({"input_data": r.input_data, "expected_output": r.expected_output or ""})
+
+    console.print(
+        f"[dim]Read {stats.rows_read} row(s): {stats.duplicates_dropped} near-duplicate(s) dropped, "
+        f"{stats.rows_skipped} skipped, {len(rows)} written across "
+        f"{len(stats.unique_by_stratum)} strata (dedup filter {stats.filter_bytes / 1e6:.0f}MB).[/dim]"
+    )
+
+
+def _metrics_exporters(
+    progress: RunProgress,
+    port: int | None,
+    path: Path | None,
+    console: Console,
+) -> ExitStack:
+    from rich.console import Console
+
+    from rightsize.metrics import MetricsFileWriter, MetricsServer
+
+    err_console = Console(stderr=True)
+
+    def _report_write_error(exc: OSError) -> None:
+        err_console.print(f"[yellow]Failed to write metrics file {path}: {exc}[/yellow]")
+
+    # Anything started before a later exporter fails is shut down by the `with`;
+    # on success pop_all() hands the running exporters to the caller.
+    with ExitStack() as stack:
+        if port is not None:
+            try:
+                server = stack.enter_context(MetricsServer(progress, port))
+            except OSError as exc:
+                raise typer.BadParameter(f"Cannot serve metrics on port {port}: {exc}") from exc
+            console.print(f"[dim]Serving metrics at {server.url}[/dim]")
+        if path is not None:
+            try:
+                stack.enter_context(MetricsFileWriter(progress, path, on_error=_report_write_error))
+            except OSError as exc:
+                raise typer.BadParameter(f"Cannot write metrics file {path}: {exc}") from exc
+        return stack.pop_all()
+
+
+def _live_progress(progress: RunProgress, phase: str, enabled: bool) -> ContextManager[object]:
+    from rich.console import Console
+    from rich.live import Live
+
+    console = Console(stderr=True)
+    if not enabled or not console.is_terminal:
+        return nullcontext()
+    return Live(
+        get_renderable=lambda: progress.render(phase),
+        console=console,
+        refresh_per_second=2,
+    )
+
+
 def _load_test_cases(path: Path) -> list[TestCase]:
+    from rightsize.models import TestCase
+
     if not path.exists():
         raise typer.BadParameter(f"CSV file not found: {path}")
     with path.open(newline="") as f:
@@ -147,6 +278,9 @@ def _load_test_cases(path: Path) -> list[TestCase]:
 
 
 def _render_models(pricing: dict[str, ModelPricing]) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
     console = Console()
     table = Table(title="OpenRouter Models (Pricing)")
     table.add_column("Model")
@@ -167,6 +301,7 @@ def _open_visualizer(
     import base64
     import zlib
     import webbrowser
+    from datetime import datetime
 
     total_rows = len(results)
     sampled_results = results[:1000]
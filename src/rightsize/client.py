@@ -3,11 +3,12 @@ from __future__ import annotations
 import asyncio
 import time
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import httpx
+if TYPE_CHECKING:
+    import httpx
 
-from rightsize.models import ModelPricing
+    from rightsize.models import ModelPricing
 
 OPENROUTER_BASE = "https://openrouter.ai/api/v1"
 
@@ -20,6 +21,8 @@ class OpenRouterClient:
 
     async def __aenter__(self) -> "OpenRouterClient":
         if self._client is None:
+            import httpx
+
             self._client = httpx.AsyncClient(
                 base_url=OPENROUTER_BASE,
                 timeout=httpx.Timeout(self.timeout),
@@ -38,6 +41,7 @@ class OpenRouterClient:
     async def _request(self, method: str, path: str, json_body: dict[str, Any] | None) -> dict[str, Any]:
         if self._client is None:
             raise RuntimeError("OpenRouterClient is not initialized. Use 'async with'.")
+        import httpx
 
         backoff = 0.5
         last_exc: Exception | None = None
@@ -80,6 +84,8 @@ class OpenRouterClient:
         return content, input_tokens, output_tokens, latency_ms
 
     async def fetch_models(self) -> dict[str, ModelPricing]:
+        from rightsize.models import ModelPricing
+
         data = await self._request("GET", "/models", None)
         models: dict[str, ModelPricing] = {}
         for item in data.get("data", []):
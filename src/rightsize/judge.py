@@ -51,7 +51,8 @@ async def judge_output(
     prompt: str,
     expected: str | None,
     actual: str,
-) -> JudgeScore:
+) -> tuple[JudgeScore, int, int]:
+    """Score ``actual`` and return ``(score, input_tokens, output_tokens)`` for the judge call."""
     if expected is None:
         judge_prompt = JUDGE_PROMPT_GENERIC.format(prompt=prompt, actual_output=actual)
     else:
@@ -59,13 +60,13 @@ async def judge_output(
             prompt=prompt, expected_output=expected, actual_output=actual
         )
     messages = [{"role": "user", "content": judge_prompt}]
-    content, _, _, _ = await client.complete(judge_model, messages, temperature=0.0)
+    content, input_tokens, output_tokens, _ = await client.complete(judge_model, messages, temperature=0.0)
     try:
         payload = json.loads(content)
         score = float(payload.get("score", 0.0))
         reasoning = str(payload.get("reasoning", "")).strip()
     except (ValueError, TypeError, json.JSONDecodeError):
-        return JudgeScore(score=0.0, reasoning="Judge response was not valid JSON.")
+        return JudgeScore(score=0.0, reasoning="Judge response was not valid JSON."), input_tokens, output_tokens
 
     score = max(0.0, min(1.0, score))
-    return JudgeScore(score=score, reasoning=reasoning)
+    return JudgeScore(score=score, reasoning=reasoning), input_tokens, output_tokens
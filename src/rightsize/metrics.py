@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+
+from rightsize.progress import RATE_WINDOW_SECONDS, ModelStats, RunProgress
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def render_openmetrics(progress: RunProgress) -> str:
+    """Render the progress counters in the OpenMetrics text format."""
+    stats = progress.snapshot()
+    lines: list[str] = []
+
+    def family(name: str, kind: str, help_text: str, samples: list[tuple[str, dict[str, str], float]]) -> None:
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"# HELP {name} {help_text}")
+        for suffix, labels, value in samples:
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{suffix}{{{label_text}}} {_format_value(value)}")
+
+    def labels(s: ModelStats, **extra: str) -> dict[str, str]:
+        return {"phase": s.phase, "model": s.model, **extra}
+
+    family(
+        "rightsize_requests",
+        "counter",
+        "Finished requests by outcome.",
+        [("_total", labels(s, outcome="success"), s.completed) for s in stats]
+        + [("_total", labels(s, outcome="failure"), s.failed) for s in stats],
+    )
+    family(
+        "rightsize_requests_expected",
+        "gauge",
+        "Requests scheduled for the run.",
+        [("", labels(s), s.total) for s in stats],
+    )
+    family(
+        "rightsize_requests_in_flight",
+        "gauge",
+        "Requests currently awaiting a response.",
+        [("", labels(s), s.in_flight) for s in stats],
+    )
+    family(
+        "rightsize_requests_per_second",
+        "gauge",
+        f"Finished requests per second over the last {RATE_WINDOW_SECONDS:g} seconds.",
+        [("", labels(s), s.requests_per_second) for s in stats],
+    )
+    family(
+        "rightsize_latency_p95_milliseconds",
+        "gauge",
+        "p95 latency over the most recent successful requests.",
+        [("", labels(s), s.latency_p95_ms) for s in stats],
+    )
+    family(
+        "rightsize_spend_usd",
+        "counter",
+        "Spend so far in USD for requests with known pricing.",
+        [("_total", labels(s), s.spend) for s in stats],
+    )
+    family(
+        "rightsize_spend_pricing_known",
+        "gauge",
+        "1 if every successful request had known pricing, 0 if spend is a lower bound.",
+        [("", labels(s), int(s.spend_known)) for s in stats],
+    )
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    # Full precision: ints stay ints and floats use repr, never `:g` truncation.
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsServer:
+    """Serve ``/metrics`` on a local port from a background thread."""
+
+    def __init__(self, progress: RunProgress, port: int, host: str = "127.0.0.1") -> None:
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = render_openmetrics(progress).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def __enter__(self) -> "MetricsServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class MetricsFileWriter:
+    """Periodically rewrite a metrics file (atomically) from a background thread.
+
+    The first write happens on enter and raises ``OSError`` so an unusable path
+    fails fast. Later write errors are passed to ``on_error`` (once per distinct
+    message) and retried on the next tick instead of killing the thread.
+    """
+
+    def __init__(
+        self,
+        progress: RunProgress,
+        path: Path,
+        interval: float = 5.0,
+        on_error: Callable[[OSError], None] | None = None,
+    ) -> None:
+        self._progress = progress
+        self._path = path
+        self._interval = interval
+        self._on_error = on_error
+        self._last_error: str | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def write(self) -> None:
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        tmp.write_text(render_openmetrics(self._progress))
+        os.replace(tmp, self._path)
+
+    def _safe_write(self) -> None:
+        try:
+            self.write()
+        except OSError as exc:
+            if str(exc) != self._last_error and self._on_error is not None:
+                self._on_error(exc)
+            self._last_error = str(exc)
+        else:
+            self._last_error = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._safe_write()
+
+    def __enter__(self) -> "MetricsFileWriter":
+        self.write()
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._safe_write()
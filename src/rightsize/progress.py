@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from rich.table import Table
+
+from rightsize.models import ModelPricing
+from rightsize.pricing import calculate_cost
+from rightsize.stats import p95
+
+LATENCY_WINDOW = 200
+RATE_WINDOW_SECONDS = 30.0
+
+
+@dataclass
+class _Counters:
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    spend: float = 0.0
+    spend_known: bool = True
+    started_at: float | None = None
+    finished_at: float | None = None
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    finish_times: deque[float] = field(default_factory=deque)
+
+
+@dataclass(frozen=True)
+class ModelStats:
+    phase: str
+    model: str
+    total: int
+    completed: int
+    failed: int
+    in_flight: int
+    requests_per_second: float
+    latency_p95_ms: float
+    spend: float
+    spend_known: bool
+
+    @property
+    def done(self) -> int:
+        return self.completed + self.failed
+
+
+class RunProgress:
+    """Thread-safe request counters per (phase, model).
+
+    The runner only bumps counters; the live view and metrics exporters read
+    snapshots on their own schedule, so there is no per-request console output.
+    """
+
+    def __init__(self, pricing: dict[str, ModelPricing] | None = None) -> None:
+        self._pricing = pricing or {}
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, str], _Counters] = {}
+
+    def set_pricing(self, pricing: dict[str, ModelPricing]) -> None:
+        self._pricing = pricing
+
+    def expect(self, phase: str, model: str, count: int) -> None:
+        with self._lock:
+            self._counters.setdefault((phase, model), _Counters()).total += count
+
+    def started(self, phase: str, model: str) -> None:
+        with self._lock:
+            c = self._counters.setdefault((phase, model), _Counters())
+            c.in_flight += 1
+            if c.started_at is None:
+                c.started_at = time.monotonic()
+
+    def finished(
+        self,
+        phase: str,
+        model: str,
+        success: bool,
+        latency_ms: float = 0.0,
+        input_tokens: int | None = None,
+        output_tokens: int | None = None,
+    ) -> None:
+        if input_tokens is None or output_tokens is None:
+            cost = None
+        else:
+            cost = calculate_cost(self._pricing, model, input_tokens, output_tokens)
+        with self._lock:
+            c = self._counters[(phase, model)]
+            now = time.monotonic()
+            c.in_flight -= 1
+            c.finished_at = now
+            c.finish_times.append(now)
+            _prune(c.finish_times, now)
+            if success:
+                c.completed += 1
+                if latency_ms > 0:
+                    c.latencies.append(latency_ms)
+            else:
+                c.failed += 1
+            if cost is None:
+                c.spend_known = c.spend_known and not success
+            else:
+                c.spend += cost
+
+    def snapshot(self) -> list[ModelStats]:
+        now = time.monotonic()
+        stats = []
+        with self._lock:
+            for (phase, model), c in self._counters.items():
+                stats.append(
+                    ModelStats(
+                        phase=phase,
+                        model=model,
+                        total=c.total,
+                        completed=c.completed,
+                        failed=c.failed,
+                        in_flight=c.in_flight,
+                        requests_per_second=_current_rate(c, now),
+                        latency_p95_ms=p95(sorted(c.latencies)),
+                        spend=c.spend,
+                        spend_known=c.spend_known,
+                    )
+                )
+        return stats
+
+    def phase_elapsed(self, phase: str) -> float:
+        now = time.monotonic()
+        with self._lock:
+            counters = [c for (p, _), c in self._counters.items() if p == phase]
+            starts = [c.started_at for c in counters if c.started_at is not None]
+            if not starts:
+                return 0.0
+            if all(_is_finished(c) for c in counters):
+                return max(c.finished_at or now for c in counters) - min(starts)
+            return now - min(starts)
+
+    def render(self, phase: str) -> Table:
+        stats = [s for s in self.snapshot() if s.phase == phase]
+        elapsed = self.phase_elapsed(phase)
+        total = sum(s.total for s in stats)
+        done = sum(s.done for s in stats)
+        rate = sum(s.requests_per_second for s in stats)
+        eta = (total - done) / rate if rate > 0 else None
+
+        table = Table(title=f"{phase.capitalize()} progress", title_justify="left")
+        table.add_column("Model")
+        table.add_column("Done", justify="right")
+        table.add_column("Failed", justify="right")
+        table.add_column("In flight", justify="right")
+        table.add_column(f"req/s ({RATE_WINDOW_SECONDS:g}s)", justify="right")
+        table.add_column("p95 (rolling)", justify="right")
+        table.add_column("Spend", justify="right")
+        for s in stats:
+            table.add_row(
+                s.model,
+                f"{s.done}/{s.total}",
+                f"[red]{s.failed}[/red]" if s.failed else "0",
+                str(s.in_flight),
+                f"{s.requests_per_second:.2f}",
+                f"{s.latency_p95_ms:.0f}ms" if s.latency_p95_ms else "—",
+                _format_spend([s]),
+            )
+        table.caption = (
+            f"{done}/{total} requests • {rate:.2f} req/s • "
+            f"spend {_format_spend(stats)} • elapsed {_format_duration(elapsed)} • "
+            f"ETA {_format_duration(eta) if eta is not None else '—'}"
+        )
+        table.caption_justify = "left"
+        return table
+
+
+def _prune(finish_times: deque[float], now: float) -> None:
+    cutoff = now - RATE_WINDOW_SECONDS
+    while finish_times and finish_times[0] < cutoff:
+        finish_times.popleft()
+
+
+def _current_rate(c: _Counters, now: float) -> float:
+    # Finished requests per second over the last RATE_WINDOW_SECONDS, so a model
+    # that stalls drops towards zero instead of coasting on its lifetime average.
+    _prune(c.finish_times, now)
+    if c.started_at is None or not c.finish_times:
+        return 0.0
+    # Floor the window at a second so the first few responses don't read as a spike.
+    window = max(1.0, min(RATE_WINDOW_SECONDS, now - c.started_at))
+    return len(c.finish_times) / window
+
+
+def _is_finished(c: _Counters) -> bool:
+    return c.in_flight == 0 and c.completed + c.failed >= c.total
+
+
+def _format_spend(stats: list[ModelStats]) -> str:
+    # A lower bound when some pricing is unknown, rather than a silent undercount.
+    total = sum(s.spend for s in stats)
+    if all(s.spend_known for s in stats):
+        return f"${total:.4f}"
+    if total == 0:
+        return "n/a"
+    return f"≥${total:.4f}"
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-import math
+import time
 from collections import defaultdict
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 from rightsize.client import OpenRouterClient
 from rightsize.judge import judge_output
 from rightsize.models import BenchmarkResult, JudgeScore, ModelPricing, RunResult, TestCase
 from rightsize.pricing import calculate_cost
+from rightsize.stats import p95
+
+if TYPE_CHECKING:
+    from rightsize.progress import RunProgress
 
 
 async def run_benchmark(
@@ -17,10 +21,14 @@ async def run_benchmark(
     template: Callable[[str], str],
     client: OpenRouterClient,
     concurrency: int,
+    progress: RunProgress | None = None,
 ) -> list[RunResult]:
     semaphore = asyncio.Semaphore(concurrency)
+    if progress is not None:
+        for model in models:
+            progress.expect("run", model, len(test_cases))
     tasks = [
-        _run_single(semaphore, client, model, tc, idx, template)
+        _run_single(semaphore, client, model, tc, idx, template, progress)
         for model in models
         for idx, tc in enumerate(test_cases)
     ]
@@ -34,15 +42,18 @@ async def _run_single(
     test_case: TestCase,
     test_case_idx: int,
     template: Callable[[str], str],
+    progress: RunProgress | None = None,
 ) -> RunResult:
     async with semaphore:
         prompt = template(test_case.input_data)
+        if progress is not None:
+            progress.started("run", model)
         try:
             messages = [{"role": "user", "content": prompt}]
             output, input_tokens, output_tokens, latency_ms = await client.complete(
                 model, messages, temperature=0.0
             )
-            return RunResult(
+            result = RunResult(
                 model=model,
                 test_case_idx=test_case_idx,
                 prompt=prompt,
@@ -53,7 +64,7 @@ async def _run_single(
                 success=True,
             )
         except Exception as exc:  # noqa: BLE001
-            return RunResult(
+            result = RunResult(
                 model=model,
                 test_case_idx=test_case_idx,
                 prompt=prompt,
@@ -64,6 +75,16 @@ async def _run_single(
                 success=False,
                 error=str(exc),
             )
+        # Reported once, after the result is built, so a validation error on a
+        # completed response (e.g. null content) is not counted twice.
+        if progress is not None:
+            if result.success:
+                progress.finished(
+                    "run", model, True, result.latency_ms, result.input_tokens, result.output_tokens
+                )
+            else:
+                progress.finished("run", model, False)
+        return result
 
 
 async def run_judging(
@@ -72,13 +93,16 @@ async def run_judging(
     judge_model: str,
     client: OpenRouterClient,
     concurrency: int,
+    progress: RunProgress | None = None,
 ) -> dict[tuple[str, int], JudgeScore]:
     semaphore = asyncio.Semaphore(concurrency)
     tasks = [
-        _judge_single(semaphore, client, judge_model, test_cases[r.test_case_idx], r)
+        _judge_single(semaphore, client, judge_model, test_cases[r.test_case_idx], r, progress)
         for r in run_results
         if r.success
     ]
+    if progress is not None:
+        progress.expect("judge", judge_model, len(tasks))
     scores = await asyncio.gather(*tasks)
     return {(score[0], score[1]): score[2] for score in scores}
 
@@ -89,15 +113,27 @@ async def _judge_single(
     judge_model: str,
     test_case: TestCase,
     result: RunResult,
+    progress: RunProgress | None = None,
 ) -> tuple[str, int, JudgeScore]:
     async with semaphore:
-        score = await judge_output(
-            client,
-            judge_model,
-            prompt=result.prompt,
-            expected=test_case.expected_output,
-            actual=result.output,
-        )
+        if progress is not None:
+            progress.started("judge", judge_model)
+        start = time.perf_counter()
+        try:
+            score, input_tokens, output_tokens = await judge_output(
+                client,
+                judge_model,
+                prompt=result.prompt,
+                expected=test_case.expected_output,
+                actual=result.output,
+            )
+        except Exception:
+            if progress is not None:
+                progress.finished("judge", judge_model, False)
+            raise
+        if progress is not None:
+            latency_ms = (time.perf_counter() - start) * 1000.0
+            progress.finished("judge", judge_model, True, latency_ms, input_tokens, output_tokens)
         return result.model, result.test_case_idx, score
 
 
@@ -114,7 +150,7 @@ def aggregate_results(
     for model, results in by_model.items():
         successful = [r for r in results if r.success]
         latencies = sorted(r.latency_ms for r in successful if r.latency_ms > 0)
-        latency_p95_ms = _p95(latencies)
+        latency_p95_ms = p95(latencies)
         scores = [
             judge_scores[(r.model, r.test_case_idx)].score
             for r in successful
@@ -143,10 +179,3 @@ def aggregate_results(
             )
         )
     return aggregated
-
-
-def _p95(values: list[float]) -> float:
-    if not values:
-        return 0.0
-    idx = max(0, math.ceil(0.95 * len(values)) - 1)
-    return values[idx]
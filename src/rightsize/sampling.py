@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import math
+import random
+import re
+import sys
+import zlib
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+CSV_SUFFIXES = {".csv"}
+OTHER_STRATUM = "(other)"
+
+_TOKEN = re.compile(r"\w+")
+_MASK32 = (1 << 32) - 1
+
+
+@dataclass(slots=True)
+class SampledRow:
+    input_data: str
+    expected_output: str | None
+    stratum: str
+    line_no: int
+
+
+@dataclass
+class SampleStats:
+    rows_read: int = 0
+    rows_skipped: int = 0
+    duplicates_dropped: int = 0
+    filter_bytes: int = 0
+    unique_by_stratum: dict[str, int] = field(default_factory=dict)
+
+
+def iter_records(path: Path) -> Iterator[tuple[int, dict[str, Any] | None]]:
+    """Stream records from a JSONL or CSV log one line at a time.
+
+    Yields ``(line_no, record)``; ``record`` is None for lines that cannot be parsed,
+    including lines that are not valid UTF-8.
+    """
+    suffix = path.suffix.lower()
+    if suffix in JSONL_SUFFIXES:
+        with path.open("rb") as f:
+            for line_no, raw in enumerate(f, start=1):
+                try:
+                    line = raw.decode("utf-8")
+                except UnicodeDecodeError:
+                    yield line_no, None
+                    continue
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    yield line_no, None
+                    continue
+                yield line_no, record if isinstance(record, dict) else None
+    elif suffix in CSV_SUFFIXES:
+        csv.field_size_limit(min(sys.maxsize, 2**31 - 1))
+        bad_lines: set[int] = set()
+        with path.open("rb") as f:
+            reader = csv.DictReader(_decode_lines(f, bad_lines))
+            if reader.fieldnames is None:
+                return
+            # line_num counts physical lines, so quoted fields spanning lines are
+            # attributed to the line the record starts on.
+            line_no = reader.line_num + 1
+            for row in reader:
+                # The reader never reads ahead, so bad lines at this point belong
+                # to this record (or to the header, which precedes line_no).
+                spans_bad = any(n >= line_no for n in bad_lines)
+                bad_lines.clear()
+                yield line_no, None if spans_bad else row
+                line_no = reader.line_num + 1
+    elif suffix == ".json":
+        raise ValueError("JSON arrays cannot be streamed; convert the log to JSONL (one object per line).")
+    else:
+        raise ValueError(f"Unsupported log format '{path.suffix}'. Use .jsonl or .csv.")
+
+
+def _decode_lines(f: IO[bytes], bad_lines: set[int]) -> Iterator[str]:
+    # Decode line by line so one bad byte only spoils its own record; offending
+    # line numbers are recorded for the caller to skip.
+    for line_no, raw in enumerate(f, start=1):
+        try:
+            yield raw.decode("utf-8")
+        except UnicodeDecodeError:
+            bad_lines.add(line_no)
+            yield raw.decode("utf-8", errors="replace")
+
+
+def get_field(record: dict[str, Any], name: str) -> str | None:
+    """Look up a possibly dotted field name (e.g. ``request.prompt``) as a string."""
+    value: Any = record
+    if name in record:
+        value = record[name]
+    else:
+        for part in name.split("."):
+            if not isinstance(value, dict) or part not in value:
+                return None
+            value = value[part]
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def length_bucket(text: str) -> str:
+    """Power-of-two bucket on whitespace token count, e.g. ``tokens 8-15``."""
+    tokens = len(text.split())
+    if tokens == 0:
+        return "tokens 0"
+    low = 1 << (tokens.bit_length() - 1)
+    return f"tokens {low}-{2 * low - 1}"
+
+
+class MinHasher:
+    """MinHash signatures via one-permutation hashing with rotation densification.
+
+    Shingles are lowercase word n-grams. Each shingle is hashed once and routed to
+    one of ``num_perm`` bins, so the cost per record is linear in its length rather
+    than ``num_perm`` times its length.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 0) -> None:
+        if num_perm < 1:
+            raise ValueError("num_perm must be positive.")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed & 0xFFFFFFFF
+
+    def shingles(self, text: str) -> set[str]:
+        tokens = _TOKEN.findall(text.lower())
+        k = self.shingle_size
+        if len(tokens) <= k:
+            return {" ".join(tokens)}
+        return {" ".join(tokens[i : i + k]) for i in range(len(tokens) - k + 1)}
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        n = self.num_perm
+        seed = self.seed
+        bins: list[int | None] = [None] * n
+        for shingle in self.shingles(text):
+            h = zlib.crc32(shingle.encode(), seed)
+            idx, value = h % n, h // n
+            current = bins[idx]
+            if current is None or value < current:
+                bins[idx] = value
+        return tuple(self._densify(bins))
+
+    def _densify(self, bins: list[int | None]) -> list[int]:
+        # Fill each empty bin from the next non-empty bin to its right (circularly),
+        # offset by the distance so borrowed values stay distinguishable. Walking
+        # right-to-left lets a single pass carry the nearest value along.
+        n = len(bins)
+        anchor = next((i for i, b in enumerate(bins) if b is not None), None)
+        if anchor is None:
+            return [0] * n
+        out = [0] * n
+        carry, distance = bins[anchor], 0
+        for step in range(n):
+            i = (anchor - step) % n
+            value = bins[i]
+            if value is not None:
+                carry, distance = value, 0
+            else:
+                distance += 1
+            out[i] = (carry + distance * 0x9E3779B9) & _MASK32
+        return out
+
+
+def lsh_params(num_perm: int, threshold: float) -> tuple[int, int]:
+    """Pick ``(bands, rows)`` with ``bands * rows <= num_perm`` whose S-curve
+    midpoint ``(1 / bands) ** (1 / rows)`` sits closest to ``threshold``."""
+    best: tuple[float, int, int] | None = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        midpoint = (1 / bands) ** (1 / rows)
+        # Bias slightly below the threshold so true near-duplicates become candidates.
+        error = abs(midpoint - threshold * 0.95)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    assert best is not None
+    return best[1], best[2]
+
+
+class SeenFilter:
+    """Fixed-size Bloom filter over LSH band keys.
+
+    A signature counts as seen when any of its bands was added before, i.e. it
+    would have been an LSH candidate of an earlier input. Memory is fixed up front
+    from ``capacity`` (expected distinct inputs); past that the false-positive rate
+    climbs gradually instead of memory growing.
+    """
+
+    def __init__(
+        self,
+        num_perm: int,
+        threshold: float,
+        capacity: int,
+        error_rate: float = 1e-2,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Dedup capacity must be at least 1.")
+        self.bands, self.rows = lsh_params(num_perm, threshold)
+        # Each input inserts one key per band; size the filter so a whole signature,
+        # not just a single key, stays under ``error_rate`` at capacity.
+        per_key = error_rate / self.bands
+        items = capacity * self.bands
+        self.num_bits = max(64, math.ceil(-items * math.log(per_key) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / items * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def _positions(self, signature: tuple[int, ...]) -> Iterator[list[int]]:
+        r, m, k = self.rows, self.num_bits, self.num_hashes
+        for band in range(self.bands):
+            key = array("I", signature[band * r : (band + 1) * r]).tobytes()
+            digest = hashlib.blake2b(key, digest_size=16, person=band.to_bytes(2, "little")).digest()
+            h1 = int.from_bytes(digest[:8], "little")
+            h2 = int.from_bytes(digest[8:], "little") | 1
+            yield [(h1 + i * h2) % m for i in range(k)]
+
+    def check_and_add(self, signature: tuple[int, ...]) -> bool:
+        """Return True if the signature was already seen; otherwise record it."""
+        bits = self._bits
+        band_positions = list(self._positions(signature))
+        for positions in band_positions:
+            if all(bits[p >> 3] & (1 << (p & 7)) for p in positions):
+                return True
+        for positions in band_positions:
+            for p in positions:
+                bits[p >> 3] |= 1 << (p & 7)
+        return False
+
+
+def sample_log(
+    path: Path,
+    size: int,
+    input_field: str = "input_data",
+    expected_field: str | None = "expected_output",
+    stratify_by: str | None = None,
+    threshold: float = 0.8,
+    num_perm: int = 128,
+    seed: int = 0,
+    dedup_capacity: int = 1_000_000,
+    max_strata: int = 100,
+) -> tuple[list[SampledRow], SampleStats]:
+    """Stream a log, drop near-duplicate inputs and return a stratified sample.
+
+    Every input is checked against all earlier distinct inputs through a
+    fixed-size :class:`SeenFilter`, so dedup is approximate (LSH candidates are not
+    re-verified) but memory does not grow with the log. Each stratum keeps a
+    reservoir of at most ``size`` rows and labels beyond ``max_strata`` are folded
+    into ``(other)``, bounding the sample side to ``size * (max_strata + 1)`` rows.
+    The final sample is allocated across strata proportionally to their distinct
+    input counts.
+    """
+    if size < 1:
+        raise ValueError("Sample size must be at least 1.")
+    if not 0.0 < threshold <= 1.0:
+        raise ValueError("Threshold must be in (0, 1].")
+    if max_strata < 1:
+        raise ValueError("max_strata must be at least 1.")
+
+    rng = random.Random(seed)
+    hasher = MinHasher(num_perm=num_perm, seed=seed)
+    seen = SeenFilter(num_perm, threshold, dedup_capacity)
+    reservoirs: dict[str, list[SampledRow]] = defaultdict(list)
+    stats = SampleStats(filter_bytes=seen.size_bytes)
+    unique_counts: dict[str, int] = defaultdict(int)
+
+    for line_no, record in iter_records(path):
+        stats.rows_read += 1
+        text = get_field(record, input_field) if record is not None else None
+        if not text or not text.strip():
+            stats.rows_skipped += 1
+            continue
+
+        if seen.check_and_add(hasher.signature(text)):
+            stats.duplicates_dropped += 1
+            continue
+
+        if stratify_by:
+            stratum = get_field(record, stratify_by) or "(missing)"
+        else:
+            stratum = length_bucket(text)
+        if stratum not in unique_counts and len(unique_counts) >= max_strata:
+            stratum = OTHER_STRATUM
+        expected = get_field(record, expected_field) if expected_field else None
+        row = SampledRow(text, expected or None, stratum, line_no)
+
+        unique_counts[stratum] += 1
+        reservoir = reservoirs[stratum]
+        if len(reservoir) < size:
+            reservoir.append(row)
+            continue
+        slot = rng.randrange(unique_counts[stratum])
+        if slot < size:
+            reservoir[slot] = row
+
+    stats.unique_by_stratum = dict(unique_counts)
+    allocation = _allocate(unique_counts, {s: len(r) for s, r in reservoirs.items()}, size)
+    sampled: list[SampledRow] = []
+    for stratum, count in allocation.items():
+        sampled.extend(rng.sample(reservoirs[stratum], count))
+    sampled.sort(key=lambda r: r.line_no)
+    return sampled, stats
+
+
+def _allocate(counts: dict[str, int], available: dict[str, int], size: int) -> dict[str, int]:
+    """Largest-remainder proportional allocation, at least one row per stratum when
+    ``size`` allows, capped at what each reservoir holds."""
+    total = sum(counts.values())
+    if total == 0:
+        return {}
+    target = min(size, sum(available.values()))
+    allocation = {s: 0 for s in counts}
+    if target >= len(counts):
+        allocation = {s: 1 for s in counts}
+    remaining = target - sum(allocation.values())
+    while remaining > 0:
+        open_strata = [s for s in counts if allocation[s] < available[s]]
+        open_total = sum(counts[s] for s in open_strata)
+        quotas = {s: remaining * counts[s] / open_total for s in open_strata}
+        granted = 0
+        for s in open_strata:
+            extra = min(int(quotas[s]), available[s] - allocation[s])
+            allocation[s] += extra
+            granted += extra
+        leftover = remaining - granted
+        by_remainder = sorted(open_strata, key=lambda s: (quotas[s] - int(quotas[s]), counts[s]), reverse=True)
+        for s in by_remainder:
+            if leftover == 0:
+                break
+            if allocation[s] < available[s]:
+                allocation[s] += 1
+                leftover -= 1
+        remaining = target - sum(allocation.values())
+    return {s: n for s, n in allocation.items() if n > 0}
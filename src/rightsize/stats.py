@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import math
+
+
+def p95(values: list[float]) -> float:
+    """Nearest-rank 95th percentile of already-sorted ``values`` (0.0 when empty)."""
+    if not values:
+        return 0.0
+    idx = max(0, math.ceil(0.95 * len(values)) - 1)
+    return values[idx]